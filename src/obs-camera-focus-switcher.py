@@ -1,18 +1,99 @@
 #!/usr/bin/env python3
 
+import win32api
+import win32con
 import win32gui
 import win32process
-import psutil
+import pywintypes
 import asyncio
 import simpleobsws
+from websockets.exceptions import ConnectionClosed
 import time
 import re
 import yaml
 import argparse
-from typing import Dict, Optional, List, Tuple, NamedTuple
-from dataclasses import dataclass
+import functools
+import logging
+import os
+import ctypes
+import threading
+from ctypes import wintypes
+from typing import Dict, Iterator, Optional, List, Tuple, NamedTuple
+from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml bindings, much faster to parse
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import re2  # Optional: google-re2 gives linear-time matching for user supplied patterns
+except ImportError:
+    re2 = None
+
+logger = logging.getLogger(__name__)
+
+# WinEvent hook constants (winuser.h)
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_OBJECT_NAMECHANGE = 0x800C
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+WM_QUIT = 0x0012
+
+# Seconds a new target scene must stay selected before switching. Alt-tabbing through
+# windows fires several foreground changes within ~100 ms; waiting this long coalesces
+# them into a single OBS request while still feeling instant.
+SWITCH_DEBOUNCE = 0.15
+
+# Exponential backoff bounds (seconds) for reconnecting after OBS closes the WebSocket
+RECONNECT_INITIAL_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
+# Window class of Chrome's top-level browser windows
+CHROME_WINDOW_CLASS = 'Chrome_WidgetWin_1'
+
+# Seconds before cached pid -> process name entries are dropped (guards against pid reuse)
+PID_CACHE_TTL = 30.0
+
+# Most recently seen window titles whose match result is remembered
+MATCH_CACHE_SIZE = 1024
+
+# Fallback poll interval (seconds) right after a state change; it doubles up to the
+# check interval while nothing changes, so follow-up changes are caught quickly
+MIN_CHECK_INTERVAL = 0.25
+
+# Seconds between housekeeping polls while no matching window exists and the hook is active
+IDLE_CHECK_INTERVAL = 30.0
+
+WinEventProcType = ctypes.WINFUNCTYPE(
+    None,
+    wintypes.HANDLE,
+    wintypes.DWORD,
+    wintypes.HWND,
+    wintypes.LONG,
+    wintypes.LONG,
+    wintypes.DWORD,
+    wintypes.DWORD
+)
+
+# Process queries (processthreadsapi.h / winerror.h)
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+ERROR_ACCESS_DENIED = 5
+MAX_PATH = 260
+
+kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+kernel32.OpenProcess.restype = wintypes.HANDLE
+kernel32.QueryFullProcessImageNameW.argtypes = [
+    wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD)
+]
+kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+kernel32.CloseHandle.restype = wintypes.BOOL
+
 @dataclass
 class MonitorScene:
     monitor: int
@@ -22,17 +103,19 @@ class MonitorScene:
 class Application:
     name: str
     patterns: List[str]
+    compiled: List[re.Pattern] = field(default_factory=list)
 
 @dataclass
 class Config:
     monitor_scenes: List[MonitorScene]
     applications: List[Application]
+    obs_config: Dict[str, str]
 
 class WindowInfo(NamedTuple):
     monitor: int
     title: str
     hwnd: int  # Window handle for checking focus
-    last_active: float  # Timestamp of last activity
+    last_active: int  # Monotonic timestamp (ns) of last activity, 0 if not focused
 
 class WindowState(NamedTuple):
     monitor: int
@@ -41,22 +124,39 @@ class WindowState(NamedTuple):
     hash: str
 
 class OBSWindowSwitcher:
-    def __init__(self, config_path: str = "etc/config.yaml", verbose: bool = False):
-        self.verbose = verbose
+    def __init__(self, config_path: str = "etc/config.yaml"):
         self.config_path = config_path
+        self._config_mtime: int = 0
+        self._config_cache: Optional[Config] = None
         self.config = self.load_config(config_path)
         self.ws = None
+        self._reconnect_lock = asyncio.Lock()
         self.current_scene: Optional[str] = None
-        self.last_state_hash: Optional[str] = None
-
-    def log(self, message):
-        if self.verbose:
-            print(message)     
+        self.last_state: Optional[Tuple[int, str, Optional[str]]] = None
+        self._foreground_changed: Optional[asyncio.Event] = None
+        self._hook_thread: Optional[threading.Thread] = None
+        self._hook_thread_id: Optional[int] = None
+        self._hook_active = False
+        self._settled_foreground: Optional[Tuple[int, str, Tuple[int, int, int, int]]] = None
+        self._win_event_proc = None  # Keep a reference so ctypes doesn't free the callback
+        self._name_hook = None  # Title change hook, scoped to the foreground window's process
+        self._name_hook_pid = 0
+        self._pending_switch_task: Optional[asyncio.Task] = None
+        self._pending_state: Optional[Tuple[int, str, Optional[str]]] = None
+        self._pid_name_cache: Dict[int, str] = {}
+        self._pid_cache_expires: float = 0.0
+        self._monitor_index: Dict[int, int] = {}
+        self._hwnd_monitor_cache: Dict[int, Tuple[Tuple[int, int, int, int], int]] = {}
+        self._refresh_monitors()
 
     def load_config(self, config_path: str) -> Config:
-        """Load and parse configuration file."""
+        """Load and parse configuration file, reusing the parsed result if it hasn't changed."""
+        mtime = os.stat(config_path).st_mtime_ns
+        if mtime == self._config_mtime and self._config_cache:
+            return self._config_cache
+
         with open(config_path, 'r') as f:
-            raw_config = yaml.safe_load(f)
+            raw_config = yaml.load(f, Loader=SafeLoader)
             
         monitor_scenes = [
             MonitorScene(
@@ -65,174 +165,642 @@ class OBSWindowSwitcher:
             )
             for item in raw_config['monitor_scenes']
         ]
+        # Reversed so the first entry for a monitor wins, as with the old linear scan
+        monitor_to_scene = {
+            monitor_scene.monitor: monitor_scene.scene
+            for monitor_scene in reversed(monitor_scenes)
+        }
         
         applications = [
             Application(
                 name=app['name'],
-                patterns=app['patterns']
+                patterns=app['patterns'],
+                compiled=[re.compile(p, re.IGNORECASE) for p in app['patterns']]
             )
             for app in raw_config['applications']
         ]
         
-        return Config(monitor_scenes=monitor_scenes, applications=applications)
+        # Flat (app name, compiled pattern) list for the matching hot path
+        all_patterns = [
+            (app.name, pattern)
+            for app in applications
+            for pattern in app.compiled
+        ]
+        combined_re, combined_groups, combined_lowercase = self._build_combined_pattern(all_patterns)
+        
+        config = Config(
+            monitor_scenes=monitor_scenes,
+            applications=applications,
+            obs_config=raw_config['obs_config']
+        )
+
+        # Only swap in lookup tables once everything parsed, so a bad reload changes nothing
+        self._monitor_to_scene: Dict[int, str] = monitor_to_scene
+        self._all_patterns: List[Tuple[str, re.Pattern]] = all_patterns
+        self._combined_re: Optional[re.Pattern] = combined_re
+        self._combined_groups: Dict[str, Tuple[str, str]] = combined_groups
+        self._combined_lowercase = combined_lowercase
+        self._match_cache = functools.lru_cache(maxsize=MATCH_CACHE_SIZE)(self._match_title)
+        self._config_mtime, self._config_cache = mtime, config
+        return config
+
+    def reload_config(self):
+        """Pick up edits to the configuration file, keeping the current config if the new one is invalid."""
+        try:
+            config = self.load_config(self.config_path)
+        except (OSError, yaml.YAMLError, KeyError, TypeError, re.error) as e:
+            logger.warning("Ignoring invalid config update: %s", e)
+            return
+        if config is not self.config:
+            logger.info("Configuration reloaded")
+            self.config = config
+            self._settled_foreground = None
+
+    def _build_combined_pattern(
+        self, patterns: List[Tuple[str, re.Pattern]]
+    ) -> Tuple[Optional[re.Pattern], Dict[str, Tuple[str, str]], bool]:
+        """
+        Fuse all patterns into one alternation so a title is scanned with a single search.
+        Each branch is a named group (p0, p1, ...) mapped to its (app name, pattern).
+        When every pattern can be lowercased safely the result is case-sensitive and must be
+        searched against the lowercased title, which the third element signals.
+        Returns (None, {}, False) if the patterns can't be fused safely.
+        """
+        groups: Dict[str, Tuple[str, str]] = {}
+        # Wrapping in groups would renumber user capture groups and break backreferences
+        if not patterns or any(pattern.groups for _, pattern in patterns):
+            return None, {}, False
+
+        branches = []
+        for i, (app_name, pattern) in enumerate(patterns):
+            group = f"p{i}"
+            groups[group] = (app_name, pattern.pattern)
+            branches.append((group, pattern.pattern))
+
+        # Prefer the lowercased, case-sensitive form; fall back to IGNORECASE on the originals
+        candidates = []
+        if all(is_lowercase_safe(source) for _, source in branches):
+            candidates.append(("|".join(f"(?P<{group}>{source.lower()})" for group, source in branches), True))
+        candidates.append(("|".join(f"(?P<{group}>{source})" for group, source in branches), False))
+
+        for combined, lowercase in candidates:
+            if re2 is not None:
+                options = re2.Options()
+                options.log_errors = False  # Rejections are expected, don't print them to stderr
+                options.case_sensitive = lowercase
+                try:
+                    return re2.compile(combined, options), groups, lowercase
+                except re2.error:
+                    pass  # Uses syntax RE2 doesn't support (lookarounds etc.), use re instead
+            try:
+                return re.compile(combined, 0 if lowercase else re.IGNORECASE), groups, lowercase
+            except re.error:
+                pass  # e.g. inline global flags that are only valid at the start of a pattern
+        return None, {}, False
 
     async def connect_obs(self):
         """Establish connection to OBS WebSocket server."""
-        with open(self.config_path, 'r') as f:
-            raw_config = yaml.safe_load(f)
-        
-        obs_config = raw_config['obs_config']
+        obs_config = self.config.obs_config
         self.ws = simpleobsws.WebSocketClient(
             url=obs_config['url'],
             password=obs_config['password']
         )
+        # Keep current_scene in step with OBS, including switches made by hand
+        self.ws.register_event_callback(self._on_scene_changed, 'CurrentProgramSceneChanged')
         await self.ws.connect()
         await self.ws.wait_until_identified()
+        await self.sync_obs_state()
+
+    async def _on_scene_changed(self, event_data: dict):
+        """Track program scene changes pushed by OBS."""
+        self.current_scene = event_data.get('sceneName')
+        logger.debug("OBS switched to %s", self.current_scene)
+
+    async def sync_obs_state(self):
+        """Fetch the current scene and scene list from OBS in a single batch."""
+        current, scene_list = await self.ws.call_batch([
+            simpleobsws.Request('GetCurrentProgramScene'),
+            simpleobsws.Request('GetSceneList')
+        ])
+        if current.ok():
+            self.current_scene = current.responseData.get('currentProgramSceneName')
+            logger.debug("Initial scene: %s", self.current_scene)
+
+        if scene_list.ok():
+            scene_names = {scene['sceneName'] for scene in scene_list.responseData.get('scenes', [])}
+            for monitor_scene in self.config.monitor_scenes:
+                if monitor_scene.scene not in scene_names:
+                    logger.warning("Scene '%s' for monitor %s does not exist in OBS", monitor_scene.scene, monitor_scene.monitor)
+
+    async def ensure_obs_connected(self):
+        """Reconnect to OBS with exponential backoff if the WebSocket session was lost."""
+        async with self._reconnect_lock:
+            delay = RECONNECT_INITIAL_DELAY
+            while not self.ws.is_identified():
+                logger.warning("OBS connection lost - reconnecting...")
+                try:
+                    await self.ws.connect()
+                    if await self.ws.wait_until_identified():
+                        await self.sync_obs_state()
+                        logger.info("Reconnected to OBS")
+                        return
+                except Exception as e:
+                    logger.warning("Reconnect failed: %s", e)
+
+                logger.debug("Retrying in %.0fs", delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    def _refresh_monitors(self):
+        """Cache the HMONITOR -> monitor index mapping from EnumDisplayMonitors."""
+        self._monitor_index = {
+            int(handle): i
+            for i, (handle, _, _) in enumerate(win32api.EnumDisplayMonitors())
+        }
+        self._hwnd_monitor_cache.clear()
+
+    def _monitor_at_point(self, x: int, y: int) -> int:
+        """Get monitor number at given coordinates."""
+        handle = win32api.MonitorFromPoint((x, y), win32con.MONITOR_DEFAULTTONULL)
+        if not handle:
+            return 0
+        index = self._monitor_index.get(int(handle))
+        if index is None:
+            # Unknown monitor, the display layout changed since we last enumerated
+            self._refresh_monitors()
+            index = self._monitor_index.get(int(handle), 0)
+        return index
+
+    def _window_monitor(self, hwnd: int, rect: Tuple[int, int, int, int]) -> int:
+        """Get the monitor a window's center is on, reusing the last answer while the window hasn't moved."""
+        cached = self._hwnd_monitor_cache.get(hwnd)
+        if cached and cached[0] == rect:
+            return cached[1]
+
+        center_x = (rect[0] + rect[2]) // 2
+        center_y = (rect[1] + rect[3]) // 2
+        monitor = self._monitor_at_point(center_x, center_y)
+        self._hwnd_monitor_cache[hwnd] = (rect, monitor)
+        return monitor
+
+    def _expire_caches(self):
+        """Drop cached process names and forget destroyed windows every PID_CACHE_TTL seconds."""
+        now = time.monotonic()
+        if now < self._pid_cache_expires:
+            return
+        self._pid_name_cache.clear()
+        self._hwnd_monitor_cache = {
+            hwnd: cached
+            for hwnd, cached in self._hwnd_monitor_cache.items()
+            if win32gui.IsWindow(hwnd)
+        }
+        self._pid_cache_expires = now + PID_CACHE_TTL
+
+    def get_process_name(self, pid: int) -> Optional[str]:
+        """Get the lowercased process name for a pid, cached for PID_CACHE_TTL seconds."""
+        self._expire_caches()
+
+        name = self._pid_name_cache.get(pid)
+        if name is None:
+            name = get_process_image_name(pid)
+            if name is None:
+                return None
+            name = name.lower()
+            self._pid_name_cache[pid] = name
+        return name
+
+    def get_chrome_window_info(self, hwnd: int, foreground_hwnd: int) -> Optional[WindowInfo]:
+        """Get information about a single Chrome window, or None if hwnd is not one."""
+        try:
+            # Cheapest checks first: class name, style and title rule out most windows before pid lookup
+            if win32gui.GetClassName(hwnd) != CHROME_WINDOW_CLASS:
+                return None
+
+            # Chrome's popups, menus and tooltips share the class but are tool or owned windows
+            ex_style = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
+            if ex_style & win32con.WS_EX_TOOLWINDOW or win32gui.GetWindow(hwnd, win32con.GW_OWNER):
+                return None
+
+            title = win32gui.GetWindowText(hwnd)
+            if not title or title.startswith('Google Chrome'):
+                return None
+
+            rect = win32gui.GetWindowRect(hwnd)
+            if rect[0] == rect[2] or rect[1] == rect[3]:
+                return None
+
+            # Electron apps share Chrome's window class, so the process still has to be checked
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            name = self.get_process_name(pid)
+            if name != 'chrome.exe':
+                return None
+        except pywintypes.error:
+            return None  # Window was destroyed while we were inspecting it
+
+        monitor = self._window_monitor(hwnd, rect)
+        
+        # Set timestamp based on focus
+        last_active = time.monotonic_ns() if hwnd == foreground_hwnd else 0
         
-        # Get initial scene
-        request = simpleobsws.Request('GetCurrentProgramScene')
-        response = await self.ws.call(request)
-        if response.ok():
-            self.current_scene = response.responseData.get('currentProgramSceneName')
-            self.log(f"Initial scene: {self.current_scene}")
-
-    def get_chrome_windows_info(self) -> List[WindowInfo]:
-        """Get information about all visible Chrome windows including focus state."""
-        windows_info = []
+        return WindowInfo(
+            monitor=monitor,
+            title=title,
+            hwnd=hwnd,
+            last_active=last_active
+        )
+
+    def iter_chrome_windows(self) -> Iterator[WindowInfo]:
+        """Yield visible Chrome windows in Z-order (topmost first), including focus state."""
         foreground_hwnd = win32gui.GetForegroundWindow()
         
-        def callback(hwnd, windows):
-            if win32gui.IsWindowVisible(hwnd):
-                _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                try:
-                    process = psutil.Process(pid)
-                    if 'chrome.exe' in process.name().lower():
-                        title = win32gui.GetWindowText(hwnd)
-                        if title and not title.startswith('Google Chrome'):
-                            rect = win32gui.GetWindowRect(hwnd)
-                            center_x = (rect[0] + rect[2]) // 2
-                            center_y = (rect[1] + rect[3]) // 2
-                            monitor = get_monitor_at_point(center_x, center_y)
-                            
-                            # Set timestamp based on focus
-                            last_active = time.time() if hwnd == foreground_hwnd else 0
-                            
-                            windows_info.append(WindowInfo(
-                                monitor=monitor,
-                                title=title,
-                                hwnd=hwnd,
-                                last_active=last_active
-                            ))
-                            self.log(f"Found window: Monitor {monitor}, Title: {title}, Focus: {hwnd == foreground_hwnd}")
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+        # EnumWindows snapshots the Z-order safely; a FindWindowEx/GetWindow walk can loop or
+        # stop early when windows close mid-walk. The class check keeps the callback cheap and
+        # leaves the rest of the inspection for the windows actually consumed.
+        def callback(hwnd, hwnds):
+            try:
+                if win32gui.GetClassName(hwnd) == CHROME_WINDOW_CLASS:
+                    hwnds.append(hwnd)
+            except pywintypes.error:
+                pass  # Destroyed during enumeration
             return True
 
-        win32gui.EnumWindows(callback, None)
-        return windows_info
+        hwnds: List[int] = []
+        win32gui.EnumWindows(callback, hwnds)
+        for hwnd in hwnds:
+            if win32gui.IsWindowVisible(hwnd):
+                window = self.get_chrome_window_info(hwnd, foreground_hwnd)
+                if window:
+                    logger.debug("Found window: Monitor %s, Title: %s, Focus: %s", window.monitor, window.title, hwnd == foreground_hwnd)
+                    yield window
+
+    def _foreground_key(self) -> Optional[Tuple[int, str, Tuple[int, int, int, int]]]:
+        """Identify the foreground window by (hwnd, title, rect), or None if there isn't one."""
+        hwnd = win32gui.GetForegroundWindow()
+        if not hwnd:
+            return None
+        try:
+            return (hwnd, win32gui.GetWindowText(hwnd), win32gui.GetWindowRect(hwnd))
+        except pywintypes.error:
+            return None  # Closed since GetForegroundWindow
+
+    def get_foreground_chrome_info(self) -> Optional[WindowInfo]:
+        """Get information about the foreground window if it is a Chrome window, without enumerating."""
+        hwnd = win32gui.GetForegroundWindow()
+        if not hwnd:
+            return None
+        return self.get_chrome_window_info(hwnd, hwnd)
 
     def is_matching_application(self, title: str) -> bool:
-        """Check if the window title matches any application patterns."""
-        for app in self.config.applications:
-            for pattern in app.patterns:
-                if re.search(pattern, title, re.IGNORECASE):
-                    self.log(f"Matched application: {app.name} with pattern: {pattern}")
-                    return True
+        """Check if the window title matches any application patterns, remembering the answer per title."""
+        return self._match_cache(title)
+
+    def _match_title(self, title: str) -> bool:
+        """Run the application patterns against a window title."""
+        if self._combined_re is not None:
+            match = self._combined_re.search(title.lower() if self._combined_lowercase else title)
+            if match:
+                app_name, pattern = self._combined_groups[match.lastgroup]
+                logger.debug("Matched application: %s with pattern: %s", app_name, pattern)
+                return True
+            return False
+
+        for app_name, pattern in self._all_patterns:
+            if pattern.search(title):
+                logger.debug("Matched application: %s with pattern: %s", app_name, pattern.pattern)
+                return True
         return False
 
     def get_scene_for_monitor(self, monitor: int) -> Optional[str]:
         """Get the configured scene name for a monitor."""
-        for monitor_scene in self.config.monitor_scenes:
-            if monitor_scene.monitor == monitor:
-                return monitor_scene.scene
-        return None
+        return self._monitor_to_scene.get(monitor)
 
     def find_best_matching_window(self, windows: List[WindowInfo]) -> Optional[Tuple[int, str]]:
         """
         Find the best matching window based on application patterns and focus/activity.
         Returns (monitor, scene_name) tuple if found, None otherwise.
         """
-        matching_windows = []
+        best = None
+        best_scene = None
+        best_ts = -1
         
-        # First, find all windows that match any application pattern
+        # Single pass over windows that match any application pattern, keeping the most recently active.
+        # The monitor lookup is a dict hit, so check it before running the patterns.
         for window in windows:
-            if self.is_matching_application(window.title):
-                scene = self.get_scene_for_monitor(window.monitor)
-                if scene:
-                    matching_windows.append((window, scene))
+            if window.last_active <= best_ts:
+                continue
+            scene = self.get_scene_for_monitor(window.monitor)
+            if scene and self.is_matching_application(window.title):
+                best, best_scene, best_ts = window, scene, window.last_active
         
-        if not matching_windows:
+        if best is None:
             return None
-            
-        # Sort matching windows by last_active timestamp (most recent first)
-        matching_windows.sort(key=lambda x: x[0].last_active, reverse=True)
         
-        # Return the monitor and scene for the most recently active window
-        best_match = matching_windows[0]
-        return (best_match[0].monitor, best_match[1])
-
-    def create_state_hash(self, monitor: int, title: str, scene: Optional[str]) -> str:
-        """Create a unique hash for the current state."""
-        return f"{monitor}:{title}:{scene if scene else 'no_match'}"
+        return (best.monitor, best_scene)
 
     async def switch_scene(self, scene_name: str):
         """Switch OBS scene if it's different from current scene."""
         if scene_name != self.current_scene:
-            self.log(f"Attempting to switch from {self.current_scene} to {scene_name}")
+            logger.debug("Attempting to switch from %s to %s", self.current_scene, scene_name)
             request = simpleobsws.Request('SetCurrentProgramScene', {
                 'sceneName': scene_name
             })
-            response = await self.ws.call(request)
+            try:
+                response = await self.ws.call(request)
+            except (simpleobsws.NotIdentifiedError, simpleobsws.MessageTimeout, ConnectionClosed) as e:
+                # Session dropped before or during the call; the next tick will retry
+                logger.warning("OBS connection lost while switching scene: %s", e)
+                return False
             if response.ok():
                 self.current_scene = scene_name
-                self.log(f"Successfully switched to {scene_name}")
+                logger.debug("Successfully switched to %s", scene_name)
                 return True
             else:
-                self.log(f"Failed to switch scene: {response}")
+                logger.warning("Failed to switch scene: %s", response)
         return False
 
+    def start_foreground_hook(self, loop: asyncio.AbstractEventLoop):
+        """Start a thread that signals the event loop when the foreground window or its title changes."""
+        self._foreground_changed = asyncio.Event()
+
+        def on_win_event(hook, event, hwnd, id_object, id_child, event_thread, event_time):
+            if event == EVENT_SYSTEM_FOREGROUND:
+                self._watch_name_changes(hwnd)
+            elif event == EVENT_OBJECT_NAMECHANGE:
+                # Name changes fire for every control of every window; only the focused
+                # window's own title (e.g. switching Chrome tabs) matters
+                if id_object != OBJID_WINDOW or id_child != CHILDID_SELF:
+                    return
+                if hwnd != win32gui.GetForegroundWindow():
+                    return
+            loop.call_soon_threadsafe(self._foreground_changed.set)
+
+        self._win_event_proc = WinEventProcType(on_win_event)
+
+        def pump():
+            # The hook must be installed on the thread that pumps its messages
+            user32 = ctypes.windll.user32
+            self._hook_thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+            user32.SetWinEventHook.restype = wintypes.HANDLE
+            user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+            hook = user32.SetWinEventHook(
+                EVENT_SYSTEM_FOREGROUND,
+                EVENT_SYSTEM_FOREGROUND,
+                0,
+                self._win_event_proc,
+                0,
+                0,
+                WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+            )
+            if not hook:
+                logger.warning("Failed to install foreground hook - falling back to polling")
+                return
+            self._watch_name_changes(win32gui.GetForegroundWindow())
+
+            self._hook_active = True
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+            self._hook_active = False
+            user32.UnhookWinEvent(hook)
+            self._watch_name_changes(0)
+
+        self._hook_thread = threading.Thread(target=pump, name="foreground-hook", daemon=True)
+        self._hook_thread.start()
+
+    def _watch_name_changes(self, hwnd: int):
+        """
+        Move the title change hook to the process owning hwnd (0 removes it).
+        Must run on the hook thread. Name changes are among the noisiest WinEvents, so
+        hooking them system-wide would run a Python callback for every process.
+        """
+        try:
+            pid = win32process.GetWindowThreadProcessId(hwnd)[1] if hwnd else 0
+        except pywintypes.error:
+            pid = 0  # Window closed before we got to it
+        if pid == self._name_hook_pid:
+            return
+        user32 = ctypes.windll.user32
+        if self._name_hook:
+            user32.UnhookWinEvent(self._name_hook)
+            self._name_hook = None
+        self._name_hook_pid = pid
+        if not pid:
+            return
+        self._name_hook = user32.SetWinEventHook(
+            EVENT_OBJECT_NAMECHANGE,
+            EVENT_OBJECT_NAMECHANGE,
+            0,
+            self._win_event_proc,
+            pid,
+            0,
+            WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+        )
+        if not self._name_hook:
+            logger.debug("Failed to watch title changes of pid %s - relying on polling", pid)
+
+    def stop_foreground_hook(self):
+        """Stop the foreground hook thread, if running."""
+        if self._hook_thread and self._hook_thread_id:
+            ctypes.windll.user32.PostThreadMessageW(self._hook_thread_id, WM_QUIT, 0, 0)
+            self._hook_thread.join(timeout=1.0)
+        self._hook_thread = None
+        self._hook_thread_id = None
+
+    async def wait_for_foreground_change(self, timeout: float):
+        """Wait until the foreground window changes, or until timeout as a polling fallback."""
+        try:
+            await asyncio.wait_for(self._foreground_changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._foreground_changed.clear()
+
+    def _schedule_switch(self, scene_name: str, state: Tuple[int, str, Optional[str]]):
+        """Switch scene after SWITCH_DEBOUNCE seconds, replacing any pending switch to another target."""
+        if self._pending_switch_task and not self._pending_switch_task.done():
+            if self._pending_state == state:
+                return
+            logger.debug("Target changed to %s - cancelling pending switch", scene_name)
+            self._pending_switch_task.cancel()
+
+        self._pending_state = state
+        self._pending_switch_task = asyncio.create_task(self._delayed_switch(scene_name, state))
+
+    def _cancel_pending_switch(self):
+        """Cancel a pending debounced switch, if any."""
+        if self._pending_switch_task and not self._pending_switch_task.done():
+            self._pending_switch_task.cancel()
+        self._pending_switch_task = None
+        self._pending_state = None
+
+    async def _delayed_switch(self, scene_name: str, state: Tuple[int, str, Optional[str]]):
+        """Wait out the debounce delay, then switch scene."""
+        await asyncio.sleep(SWITCH_DEBOUNCE)
+        # Not shielded, so switches cancelled during an outage stop waiting for the reconnect
+        await self.ensure_obs_connected()
+        if state != self._pending_state:
+            return  # A newer target was picked while OBS was unreachable
+        # Shielded so a cancel can't interrupt a request OBS may already have applied
+        switched = await asyncio.shield(self.switch_scene(scene_name))
+        # Already being on the scene counts too, otherwise the state never settles
+        if switched or self.current_scene == scene_name:
+            self.last_state = state
+            logger.debug("Updated state to: %s", self.last_state)
+
     async def monitor_chrome_windows(self, check_interval: float = 1.0):
         """Main loop to monitor Chrome windows and switch scenes."""
-        self.log("Starting monitoring loop...")
-        
+        logger.debug("Starting monitoring loop (switch debounce: %.0f ms)...", SWITCH_DEBOUNCE * 1000)
+        self.start_foreground_hook(asyncio.get_running_loop())
+        try:
+            await self._monitor_loop(check_interval)
+        finally:
+            self._cancel_pending_switch()
+            self.stop_foreground_hook()
+
+    def _evaluate_windows(self):
+        """
+        Blocking part of a tick: pick up config edits, read window state and find the best match.
+        Returns (foreground key, foreground Chrome window, best match), or None if the settled
+        foreground window hasn't changed since the last tick.
+        """
+        self.reload_config()
+
+        # Nothing to do if the settled foreground window hasn't changed, moved or retitled
+        foreground = self._foreground_key()
+        if foreground is not None and foreground == self._settled_foreground:
+            return None
+        self._settled_foreground = None
+
+        # A focused Chrome window decides on its own; only enumerate when focus is outside Chrome
+        foreground_window = self.get_foreground_chrome_info()
+        if foreground_window is not None:
+            return foreground, foreground_window, self.find_best_matching_window([foreground_window])
+
+        # No Chrome window is focused, so none is more recently active than another
+        # and the topmost match wins; stop walking windows as soon as it's found
+        for window in self.iter_chrome_windows():
+            best_match = self.find_best_matching_window([window])
+            if best_match:
+                return foreground, None, best_match
+        return foreground, None, None
+
+    async def _monitor_loop(self, check_interval: float):
+        """Evaluate windows on every foreground change, polling at most every check_interval as a fallback."""
+        interval = min(MIN_CHECK_INTERVAL, check_interval)
         while True:
-            windows = self.get_chrome_windows_info()
-            
-            # Find best matching window considering focus and activity
-            best_match = self.find_best_matching_window(windows)
+            # Win32 calls block, so run them in a worker thread to keep the
+            # event loop free for OBS WebSocket traffic
+            evaluation = await asyncio.to_thread(self._evaluate_windows)
+            if evaluation is None:
+                interval = min(interval * 2, check_interval)
+                await self.wait_for_foreground_change(interval)
+                continue
+            foreground, foreground_window, best_match = evaluation
             
             if best_match:
                 monitor, scene_name = best_match
-                current_hash = self.create_state_hash(monitor, "active_window", scene_name)
-                
-                self.log(f"\nCurrent state:")
-                self.log(f"Monitor: {monitor}")
-                self.log(f"Scene: {scene_name}")
-                self.log(f"Current hash: {current_hash}")
-                self.log(f"Last hash: {self.last_state_hash}")
+                current_state = (monitor, "active_window", scene_name)
+            else:
+                current_state = (0, "no_window", None)
+            changed = current_state != self.last_state
+            
+            if best_match:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("\nCurrent state:")
+                    logger.debug("Monitor: %s", monitor)
+                    logger.debug("Scene: %s", scene_name)
+                    logger.debug("Current state: %s", current_state)
+                    logger.debug("Last state: %s", self.last_state)
                 
-                if current_hash != self.last_state_hash:
-                    self.log("State change detected!")
-                    if await self.switch_scene(scene_name):
-                        self.last_state_hash = current_hash
-                        self.log(f"Updated state hash to: {self.last_state_hash}")
+                if changed:
+                    logger.debug("State change detected!")
+                    self._schedule_switch(scene_name, current_state)
+                else:
+                    # Back on the current target before a pending switch fired
+                    self._cancel_pending_switch()
+                    if foreground_window is not None:
+                        self._settled_foreground = foreground
             else:
-                current_hash = self.create_state_hash(0, "no_window", None)
-                if current_hash != self.last_state_hash:
-                    self.log("No matching windows found - keeping current scene")
-                    self.last_state_hash = current_hash
+                self._cancel_pending_switch()
+                if changed:
+                    logger.debug("No matching windows found - keeping current scene")
+                    self.last_state = current_state
+            
+            interval = min(MIN_CHECK_INTERVAL, check_interval) if changed else min(interval * 2, check_interval)
             
-            await asyncio.sleep(check_interval)
+            # Nothing to track, so rely on the hook and only poll occasionally for housekeeping
+            idle = best_match is None and self._hook_active
+            await self.wait_for_foreground_change(IDLE_CHECK_INTERVAL if idle else interval)
 
-def get_monitor_at_point(x: int, y: int) -> int:
-    """Get monitor number at given coordinates."""
-    import win32api
-    
-    monitors = win32api.EnumDisplayMonitors()
-    for i, (handle, device, rect) in enumerate(monitors):
-        if rect[0] <= x <= rect[2] and rect[1] <= y <= rect[3]:
-            return i
-    return 0
+def is_lowercase_safe(pattern: str) -> bool:
+    """
+    Check whether lowercasing a pattern keeps its meaning against a lowercased title.
+    Rejects escapes that change when lowercased (\\D, \\S, \\W, ...), escapes that name a
+    character by code (\\x, \\u, octal), character class ranges that span letter case and
+    inline flag groups such as (?-i:...), which would switch case sensitivity back on.
+    """
+    in_class = False
+    prev = None  # Previous literal inside a character class, a possible range start
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\':
+            nxt = pattern[i + 1:i + 2]
+            if nxt.isupper() or nxt.isdigit() or nxt in ('x', 'u'):
+                return False
+            prev = None  # Conservatively never treat an escape as a range endpoint
+            i += 2
+            continue
+        if not in_class:
+            # Extension groups like (?:, (?P, (?= are fine; a flag letter or '-' sets flags
+            if c == '(' and pattern[i + 1:i + 2] == '?' and pattern[i + 2:i + 3] in tuple('aiLmsux-'):
+                return False
+            if c == '[':
+                in_class = True
+                prev = None
+                i += 1
+                # '^' negates and a leading ']' is a literal, neither starts a range
+                if pattern[i:i + 1] == '^':
+                    i += 1
+                if pattern[i:i + 1] == ']':
+                    prev = ']'
+                    i += 1
+                continue
+        elif c == ']':
+            in_class = False
+        elif c == '-' and prev is not None and pattern[i + 1:i + 2] not in ('', ']'):
+            hi = pattern[i + 1]
+            if hi == '\\':
+                return False
+            changes = prev.lower() != prev or hi.lower() != hi
+            both_upper_ascii = 'A' <= prev <= 'Z' and 'A' <= hi <= 'Z'
+            if changes and not both_upper_ascii:
+                return False
+            prev = None
+            i += 2
+            continue
+        else:
+            prev = c
+        i += 1
+    return True
+
+def get_process_image_name(pid: int) -> Optional[str]:
+    """
+    Get the executable file name (e.g. 'chrome.exe') of a process.
+    Returns '' if the name can't be read (e.g. protected system processes) and None if
+    the process is gone.
+    """
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return '' if ctypes.get_last_error() == ERROR_ACCESS_DENIED else None
+    try:
+        buffer = ctypes.create_unicode_buffer(MAX_PATH)
+        size = wintypes.DWORD(MAX_PATH)
+        if not kernel32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+            return ''
+        return buffer.value.rsplit('\\', 1)[-1]
+    finally:
+        kernel32.CloseHandle(handle)
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -252,6 +820,9 @@ def parse_arguments():
 async def main():
     # Parse command line arguments
     args = parse_arguments()
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+    # Only our own logger follows --verbose; simpleobsws would otherwise dump every message, auth included
+    logger.setLevel(logging.DEBUG if args.verbose else logging.WARNING)
     
     # Check if config file exists
     config_path = Path(args.config)
@@ -262,7 +833,7 @@ async def main():
         
     try:
         # Initialize the window switcher with config file
-        switcher = OBSWindowSwitcher(str(config_path), args.verbose)
+        switcher = OBSWindowSwitcher(str(config_path))
         
         # Connect to OBS
         await switcher.connect_obs()